@@ -14,9 +14,9 @@ Usage:
 
 __version__ = "0.1.4"
 
-from .logger import get_logger
+from .logger import _LazyLogger, get_logger
 
-logger = get_logger()
+logger = _LazyLogger()
 
 __all__ = [
     "logger",
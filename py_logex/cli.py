@@ -3,32 +3,60 @@
 import argparse
 import sys
 from pathlib import Path
-from typing import Optional
-
-import yaml
+from typing import List, Optional
 
 from . import __version__
-from .config import get_config_manager
+from .config import _load_yaml, get_config_manager
 from .defaults import get_default_yaml
 from .utils import get_script_name
 
 
+def _write_lines(lines: List[str]) -> None:
+    """Write lines to stdout with a single write call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _write_bytes(data: bytes) -> None:
+    """Write raw bytes to stdout, bypassing text decoding where possible."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode(sys.stdout.encoding or "utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _fail(lines: List[str], message: str) -> int:
+    """Write pending stdout lines, then report an error on stderr."""
+    _write_lines(lines)
+    print(message, file=sys.stderr)
+    return 1
+
+
 def cmd_config_show(args) -> int:
     """Show current configuration file location."""
     try:
         config_manager = get_config_manager()
         config_path = config_manager.discover_config()
-
-        print(f"Configuration file: {config_path}")
-        print(f"Exists: {config_path.exists()}")
-
-        if config_path.exists():
-            print("\nConfiguration content:")
-            print("-" * 60)
-            with open(config_path, "r") as f:
-                print(f.read())
-            print("-" * 60)
-
+        if config_path is None:
+            return _fail([], "Error: No configuration file found")
+
+        lines = [f"Configuration file: {config_path}"]
+
+        try:
+            content = config_path.read_bytes()
+        except FileNotFoundError:
+            lines.append("Exists: False")
+            _write_lines(lines)
+            return 0
+
+        lines += ["Exists: True", "\nConfiguration content:", "-" * 60, ""]
+        encoding = sys.stdout.encoding or "utf-8"
+        output = "\n".join(lines).encode(encoding)
+        output += content + ("\n" + "-" * 60 + "\n").encode(encoding)
+        _write_bytes(output)
         return 0
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -64,59 +92,49 @@ def cmd_config_init(args) -> int:
 
 def cmd_config_validate(args) -> int:
     """Validate configuration file."""
+    import yaml
+
+    lines: List[str] = []
     try:
         config_path = Path(args.config) if args.config else None
 
         if config_path is None:
             config_manager = get_config_manager()
             config_path = config_manager.discover_config()
+            if config_path is None:
+                return _fail(lines, "Error: No configuration file found")
 
-        print(f"Validating: {config_path}")
+        lines.append(f"Validating: {config_path}")
 
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        with open(config_path, "rb") as f:
+            config = _load_yaml(f)
 
         if config is None:
-            print("Warning: Configuration file is empty", file=sys.stderr)
-            return 1
+            return _fail(lines, "Warning: Configuration file is empty")
 
         required_sections = ["logger"]
         missing = [s for s in required_sections if s not in config]
 
         if missing:
-            print(f"Warning: Missing sections: {', '.join(missing)}", file=sys.stderr)
-            return 1
+            return _fail(lines, f"Warning: Missing sections: {', '.join(missing)}")
 
-        print("✓ Configuration is valid")
+        lines.append("✓ Configuration is valid")
+        _write_lines(lines)
         return 0
 
     except yaml.YAMLError as e:
-        print(f"Error: Invalid YAML syntax: {e}", file=sys.stderr)
-        return 1
+        return _fail(lines, f"Error: Invalid YAML syntax: {e}")
     except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
-
-
-def main(argv: Optional[list] = None) -> int:
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description="py_logex - Simple, powerful logging with exception handling",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    subparsers.add_parser("version", help="Show version")
+        return _fail(lines, f"Error: {e}")
 
-    config_parser = subparsers.add_parser("config", help="Manage configuration")
-    config_subparsers = config_parser.add_subparsers(dest="subcommand")
 
-    show_parser = config_subparsers.add_parser(
-        "show", help="Show current configuration"
-    )
+def _add_show_parser(subparsers) -> None:
+    show_parser = subparsers.add_parser("show", help="Show current configuration")
     show_parser.set_defaults(func=cmd_config_show)
 
-    init_parser = config_subparsers.add_parser(
+
+def _add_init_parser(subparsers) -> None:
+    init_parser = subparsers.add_parser(
         "init", help="Initialize new configuration file"
     )
     init_parser.add_argument(
@@ -128,12 +146,48 @@ def main(argv: Optional[list] = None) -> int:
     )
     init_parser.set_defaults(func=cmd_config_init)
 
-    validate_parser = config_subparsers.add_parser(
+
+def _add_validate_parser(subparsers) -> None:
+    validate_parser = subparsers.add_parser(
         "validate", help="Validate configuration file"
     )
     validate_parser.add_argument("-c", "--config", help="Config file to validate")
     validate_parser.set_defaults(func=cmd_config_validate)
 
+
+_CONFIG_SUBCOMMANDS = {
+    "show": _add_show_parser,
+    "init": _add_init_parser,
+    "validate": _add_validate_parser,
+}
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Main CLI entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv == ["version"]:
+        print(f"py_logex version {__version__}")
+        return 0
+
+    parser = argparse.ArgumentParser(
+        description="py_logex - Simple, powerful logging with exception handling",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    subparsers.add_parser("version", help="Show version")
+
+    config_parser = subparsers.add_parser("config", help="Manage configuration")
+    config_subparsers = config_parser.add_subparsers(dest="subcommand")
+
+    # Only build the requested subcommand; help and errors need all of them.
+    requested = argv[1] if len(argv) > 1 and argv[0] == "config" else None
+    for name, add_parser in _CONFIG_SUBCOMMANDS.items():
+        if requested not in _CONFIG_SUBCOMMANDS or name == requested:
+            add_parser(config_subparsers)
+
     args = parser.parse_args(argv)
 
     if args.command == "version":
@@ -1,10 +1,10 @@
 """Configuration discovery and loading for py_logex."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from types import MappingProxyType
+from typing import IO, Any, Dict, Mapping, Optional, Tuple, Union
 
 from .defaults import get_default_yaml
 from .utils import (
@@ -14,6 +14,63 @@ from .utils import (
     walk_up_find_file,
 )
 
+_DEFAULT_CONSOLE: Mapping[str, Any] = MappingProxyType(
+    {"enabled": True, "level": "INFO"}
+)
+
+_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {
+        "level": "INFO",
+        "rotation": "500 MB",
+        "retention": "10 days",
+        "compression": "zip",
+        "enqueue": True,
+        "buffer_size": 0,
+        "flush_interval": 0.1,
+        "backtrace": False,
+        "diagnose": False,
+        "format": "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+    }
+)
+
+_PARSE_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+@lru_cache(maxsize=None)
+def _safe_loader() -> type:
+    """Pick the fastest available safe loader (libyaml's when compiled in)."""
+    import yaml
+
+    loader: type
+    try:
+        loader = yaml.CSafeLoader
+    except AttributeError:
+        loader = yaml.SafeLoader
+    return loader
+
+
+def _load_yaml(stream: Union[str, IO[bytes]]) -> Any:
+    """
+    Parse YAML with the fastest available safe loader.
+
+    PyYAML is imported here rather than at module level, so importing
+    py_logex (whose default logger is configured lazily) does not pay for it.
+    """
+    import yaml
+
+    return yaml.load(stream, Loader=_safe_loader())
+
+
+def _substitute_script_name(value: Any, script_name: str) -> Any:
+    """Replace ``{script_name}`` in every string of a parsed config section."""
+    if isinstance(value, str):
+        if "{script_name}" in value:
+            return value.replace("{script_name}", script_name)
+        return value
+    if isinstance(value, dict):
+        return {k: _substitute_script_name(v, script_name) for k, v in value.items()}
+    return value
+
 
 class ConfigManager:
     """Manages configuration discovery and loading."""
@@ -24,8 +81,10 @@ class ConfigManager:
     def __init__(self):
         self._config: Optional[Dict[str, Any]] = None
         self._config_path: Optional[Path] = None
+        self._cache_key: Optional[Path] = None
+        self._discovered_path: Optional[Path] = None
 
-    def discover_config(self) -> Path:
+    def discover_config(self, create_if_missing: bool = True) -> Optional[Path]:
         """
         Discover logging.yaml using multi-level fallback strategy.
 
@@ -33,11 +92,32 @@ class ConfigManager:
         1. PYLOGEX_CONFIG environment variable
         2. Walk up directory tree from script location
         3. Common conventional locations
-        4. Create default in current directory
+        4. Create default in current directory (if ``create_if_missing``)
+
+        The result is remembered and returned directly by later calls while
+        the file still exists; ``invalidate()`` forces a fresh search.
+
+        Args:
+            create_if_missing: Write a default config file to the current
+                directory when none is found.
 
         Returns:
-            Path to configuration file
+            Path to configuration file, or None if none was found and
+            ``create_if_missing`` is False
         """
+        if self._discovered_path is not None and self._discovered_path.exists():
+            return self._discovered_path
+
+        path = self._find_config()
+        if path is None and create_if_missing:
+            path = Path.cwd() / self.CONFIG_FILENAME
+            self._create_default_config(path)
+
+        self._discovered_path = path
+        return path
+
+    def _find_config(self) -> Optional[Path]:
+        """Search the locations described in ``discover_config``."""
         env_config = os.environ.get(self.ENV_VAR)
         if env_config:
             path = Path(env_config)
@@ -56,9 +136,7 @@ class ConfigManager:
             if location.exists():
                 return location
 
-        default_path = Path.cwd() / self.CONFIG_FILENAME
-        self._create_default_config(default_path)
-        return default_path
+        return None
 
     def _create_default_config(self, path: Path) -> None:
         """
@@ -79,26 +157,78 @@ class ConfigManager:
         """
         Load configuration from YAML file.
 
+        Parsed files are cached by path, modification time and size, so
+        reloading an unchanged file does not re-parse it. ``{script_name}``
+        placeholders in the ``logger`` section are substituted once here.
+        The returned dictionary is shared with the cache and should not be
+        mutated.
+
         Args:
-            config_path: Optional path to config file. If None, auto-discover.
+            config_path: Optional path to config file. If None, auto-discover;
+                when no file is found, the built-in defaults are used without
+                writing a file.
 
         Returns:
             Configuration dictionary
         """
         if config_path is None:
-            config_path = self.discover_config()
+            config_path = self.discover_config(create_if_missing=False)
 
+        if config_path is None:
+            self._config_path = None
+            self._cache_key = None
+            self._config = self._parse(get_default_yaml(get_script_name()))
+            return self._config
+
+        config_path = Path(config_path)
         self._config_path = config_path
+        # Keyed on the resolved file: the same relative path names different
+        # files from different working directories.
+        cache_key = self._cache_key = config_path.resolve()
+
+        st = cache_key.stat()
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            self._config = cached[2]
+            return self._config
 
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        with open(cache_key, "rb") as f:
+            config = self._parse(f)
+
+        _PARSE_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, config)
+        self._config = config
+        return config
+
+    @staticmethod
+    def _parse(stream: Union[str, IO[bytes]]) -> Dict[str, Any]:
+        """Parse YAML into a config dict with ``{script_name}`` resolved."""
+        config = _load_yaml(stream)
 
         if config is None:
             config = {}
 
-        self._config = config
+        if isinstance(config.get("logger"), dict):
+            config["logger"] = _substitute_script_name(
+                config["logger"], get_script_name()
+            )
+
         return config
 
+    def invalidate(self, config_path: Optional[Path] = None) -> None:
+        """
+        Drop the loaded configuration, cached parse and discovered path.
+
+        Args:
+            config_path: Config file whose cached parse to drop. Defaults to
+                the currently loaded file.
+        """
+        if config_path is not None:
+            _PARSE_CACHE.pop(Path(config_path).resolve(), None)
+        elif self._cache_key is not None:
+            _PARSE_CACHE.pop(self._cache_key, None)
+        self._config = None
+        self._discovered_path = None
+
     def get_config(self) -> Dict[str, Any]:
         """
         Get loaded configuration.
@@ -130,28 +260,18 @@ class ConfigManager:
             Logger configuration with defaults applied
         """
         config = self.get_config()
-        logger_config = config.get("logger", {})
-
-        defaults = {
-            "file": f"{get_script_name()}.log",
-            "level": "INFO",
-            "rotation": "500 MB",
-            "retention": "10 days",
-            "compression": "zip",
-            "format": "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-            "console": {"enabled": True, "level": "INFO"},
-        }
+        logger_config = config.get("logger") or {}
 
-        result = defaults.copy()
+        result = {"file": f"{get_script_name()}.log", **_DEFAULTS}
+        result.update(
+            (k, v) for k, v in logger_config.items() if v is not None and k != "console"
+        )
 
-        for key, value in logger_config.items():
-            if key == "console" and isinstance(value, dict):
-                result["console"] = {**defaults["console"], **value}
-            elif value is not None:
-                result[key] = value
-
-        if "{script_name}" in result["file"]:
-            result["file"] = result["file"].replace("{script_name}", get_script_name())
+        console = logger_config.get("console")
+        result["console"] = {
+            **_DEFAULT_CONSOLE,
+            **(console if isinstance(console, dict) else {}),
+        }
 
         return result
 
@@ -1,108 +1,221 @@
 """Enhanced exception handling for py_logex."""
 
+import linecache
+import os
 import traceback
-from pathlib import Path
-from typing import List, Optional
+from functools import lru_cache
+from types import TracebackType
+from typing import Any, Dict, Iterator, List, Optional
 
 
-class ExceptionFormatter:
-    """Formats exceptions with enhanced file/line information."""
+def _format_exception(
+    exc: Exception, include_locals: bool = True, max_frames: Optional[int] = None
+) -> str:
+    """Format exception with detailed traceback information."""
+    return "\n".join(_format_exception_lines(exc, include_locals, max_frames))
+
+
+def _format_exception_lines(
+    exc: Exception, include_locals: bool = True, max_frames: Optional[int] = None
+) -> List[str]:
+    """Format exception as a list of lines, ready to be joined with newlines."""
+    exc_type = type(exc).__name__
+    exc_msg = str(exc)
+
+    tb = exc.__traceback__
+    if tb is None:
+        return [f"{exc_type}: {exc_msg}"]
+
+    frames = list(traceback.walk_tb(tb))
+    if max_frames:
+        frames = frames[-max_frames:]
+
+    lines = [f"\n{exc_type}: {exc_msg}"]
+    lines.append("\nTraceback (most recent call last):")
+
+    checked = set()
+    for frame, lineno in frames:
+        code = frame.f_code
+        filename = code.co_filename
+        if filename not in checked:
+            checked.add(filename)
+            _refresh_source(filename, frame.f_globals)
+        source = _source_line(filename, lineno)
+        lines.append(_format_frame(filename, lineno, code.co_name, source))
+    lines.append(f"\n{exc_type}: {exc_msg}")
+
+    return lines
+
+
+def _refresh_source(filename: str, module_globals: Dict[str, Any]) -> None:
+    """
+    Make linecache's copy of a source file current, as ``extract_tb`` does.
+
+    ``checkcache`` drops entries for files edited since they were read, and
+    ``lazycache`` lets linecache fetch source through the module's loader
+    (zip imports, frozen apps).
+    """
+    linecache.checkcache(filename)
+    linecache.lazycache(filename, module_globals)
+
+
+def _source_line(filename: str, lineno: int) -> str:
+    """Return the stripped source line from linecache's in-memory copy."""
+    return linecache.getline(filename, lineno).strip()
+
+
+@lru_cache(maxsize=1024)
+def _format_frame(filename: str, lineno: int, name: str, source: str) -> str:
+    """
+    Render one traceback entry, with its source line when available.
+
+    Entries repeat whenever the same call site raises again, so they are
+    cached instead of rebuilding ``FrameSummary`` objects on every exception.
+    The source line is part of the key, so edited files render fresh entries.
+    """
+    entry = f'  File "{filename}", line {lineno}, in {name}'
+    if source:
+        entry += f"\n    {source}"
+    return entry
 
-    @staticmethod
-    def format_exception(
-        exc: Exception, include_locals: bool = True, max_frames: Optional[int] = None
-    ) -> str:
-        """Format exception with detailed traceback information."""
-        exc_type = type(exc).__name__
-        exc_msg = str(exc)
-
-        tb = exc.__traceback__
-        if tb is None:
-            return f"{exc_type}: {exc_msg}"
-
-        frames = traceback.extract_tb(tb)
-        if max_frames:
-            frames = frames[-max_frames:]
-
-        lines = [f"\n{exc_type}: {exc_msg}"]
-        lines.append("\nTraceback (most recent call last):")
-
-        for frame in frames:
-            file_path = Path(frame.filename)
-            lines.append(f'  File "{file_path}", line {frame.lineno}, in {frame.name}')
-            if frame.line:
-                lines.append(f"    {frame.line.strip()}")
-        lines.append(f"\n{exc_type}: {exc_msg}")
-
-        return "\n".join(lines)
-
-    @staticmethod
-    def _extract_frames(exc: Exception) -> List:
-        """Extract frames from exception traceback."""
-        tb = exc.__traceback__
-        if tb is None:
-            return []
-        return traceback.extract_tb(tb)
-
-    @staticmethod
-    def get_exception_context(exc: Exception) -> dict:
-        """Extract context information from exception."""
-        frames = ExceptionFormatter._extract_frames(exc)
-
-        if not frames:
-            return {
-                "type": type(exc).__name__,
-                "message": str(exc),
-                "file": None,
-                "line": None,
-                "function": None,
-            }
-
-        last_frame = frames[-1]
+
+def _last_traceback(exc: Exception) -> Optional[TracebackType]:
+    """Return the innermost traceback entry of an exception."""
+    tb = exc.__traceback__
+    if tb is None:
+        return None
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    return tb
+
+
+@lru_cache(maxsize=256)
+def _basename(filename: str) -> str:
+    """Memoized ``os.path.basename``; traceback filenames repeat heavily."""
+    return os.path.basename(filename)
+
+
+def _get_exception_context(exc: Exception) -> dict:
+    """Extract context information from exception."""
+    tb = _last_traceback(exc)
+
+    if tb is None:
         return {
             "type": type(exc).__name__,
             "message": str(exc),
-            "file": str(Path(last_frame.filename).name),
-            "full_path": last_frame.filename,
-            "line": last_frame.lineno,
-            "function": last_frame.name,
-            "code": last_frame.line.strip() if last_frame.line else None,
+            "file": None,
+            "full_path": None,
+            "line": None,
+            "function": None,
+            "code": None,
         }
 
+    code = tb.tb_frame.f_code
+    filename = code.co_filename
+    _refresh_source(filename, tb.tb_frame.f_globals)
+    source = _source_line(filename, tb.tb_lineno)
+    return {
+        "type": type(exc).__name__,
+        "message": str(exc),
+        "file": _basename(filename),
+        "full_path": filename,
+        "line": tb.tb_lineno,
+        "function": code.co_name,
+        "code": source or None,
+    }
 
-_formatter = ExceptionFormatter()
-_LEVEL_METHOD_MAP = {
-    "DEBUG": "debug",
-    "INFO": "info",
-    "WARNING": "warning",
-    "CRITICAL": "critical",
-}
 
+class ExceptionFormatter:
+    """Formats exceptions with enhanced file/line information."""
+
+    # The module-level functions themselves, so calls through the class don't
+    # pay for an extra forwarding frame.
+    format_exception = staticmethod(_format_exception)
+    format_exception_lines = staticmethod(_format_exception_lines)
+    get_exception_context = staticmethod(_get_exception_context)
 
-def format_exception_for_logging(
-    exc: Exception, level: str = "ERROR", context: Optional[dict] = None
-) -> str:
-    """Format exception specifically for logging output."""
-    exc_context = _formatter.get_exception_context(exc)
 
-    parts = []
+def _format_location(exc_context: Dict[str, Any]) -> str:
+    """Render ``file:function:line`` for an exception context."""
+    location = str(exc_context["file"])
+    if exc_context["function"]:
+        location += f":{exc_context['function']}"
+    if exc_context["line"]:
+        location += f":{exc_context['line']}"
+    return location
 
-    parts.append(f"{exc_context['type']}: {exc_context['message']}")
+
+def _iter_log_parts(
+    exc: Exception, exc_context: dict, context: Optional[dict]
+) -> Iterator[str]:
+    """Yield the lines of a formatted exception log message."""
+    yield f"{exc_context['type']}: {exc_context['message']}"
 
     if exc_context["file"]:
-        location = f"{exc_context['file']}"
-        if exc_context["function"]:
-            location += f":{exc_context['function']}"
-        if exc_context["line"]:
-            location += f":{exc_context['line']}"
-        parts.append(f"Location: {location}")
+        yield "Location: " + _format_location(exc_context)
 
     if exc_context["code"]:
-        parts.append(f"Code: {exc_context['code']}")
+        yield "Code: " + exc_context["code"]
 
-    parts.append("\n" + _formatter.format_exception(exc))
+    yield ""
+    yield from _format_exception_lines(exc)
 
     if context:
-        parts.append(f"\nContext: {context}")
+        yield f"\nContext: {context}"
+
 
-    return "\n".join(parts)
+def _clear_tracebacks(exc: BaseException) -> None:
+    """Drop the tracebacks of an exception and of its cause/context chain."""
+    seen = set()
+    pending = [exc]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        current.__traceback__ = None
+        if current.__cause__ is not None:
+            pending.append(current.__cause__)
+        if current.__context__ is not None:
+            pending.append(current.__context__)
+
+
+def format_exception_for_logging(
+    exc: Exception,
+    level: str = "ERROR",
+    context: Optional[dict] = None,
+    clear_traceback: bool = False,
+) -> str:
+    """
+    Format exception specifically for logging output.
+
+    With ``clear_traceback=True`` the exception's traceback (and those of its
+    ``__cause__``/``__context__`` chain) is consumed: it is set to ``None``
+    once the message is built, so the frames it references are freed right
+    away instead of waiting for the cyclic garbage collector.
+    """
+    message = "\n".join(_iter_log_parts(exc, _get_exception_context(exc), context))
+    if clear_traceback:
+        _clear_tracebacks(exc)
+    return message
+
+
+class _LazyExceptionLog:
+    """
+    Defer ``format_exception_for_logging`` until the message is rendered.
+
+    Passed to loguru as a ``"{}"`` argument, so exceptions logged at a level
+    no sink accepts are never formatted.
+    """
+
+    __slots__ = ("exc", "context", "_text")
+
+    def __init__(self, exc: Exception, context: Optional[dict] = None):
+        self.exc = exc
+        self.context = context
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = format_exception_for_logging(self.exc, context=self.context)
+        return self._text
@@ -1,104 +1,151 @@
 """Logger implementation for py_logex."""
 
+import os
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from loguru import logger as _loguru_logger
 
 from .config import get_config_manager
-from .exceptions import format_exception_for_logging
+from .exceptions import _LazyExceptionLog
+from .sinks import BufferedFileSink
 from .utils import ensure_directory_exists
 
 _handler_ids = []
+_default_handler_removed = False
+_buffered_sink: Optional[BufferedFileSink] = None
+_active_sink_config: Optional[Tuple[Dict[str, Any], Path]] = None
+
+_LEVEL_DISPATCH = {
+    "DEBUG": _loguru_logger.debug,
+    "INFO": _loguru_logger.info,
+    "WARNING": _loguru_logger.warning,
+    "ERROR": _loguru_logger.error,
+    "CRITICAL": _loguru_logger.critical,
+}
+
+
+@lru_cache(maxsize=32)
+def _resolve_log_path(log_file: str, cwd: str) -> Path:
+    """Resolve a configured log file against the working directory."""
+    log_path = Path(log_file)
+
+    if log_path.is_absolute():
+        return log_path
+
+    return (Path(cwd) / log_path).resolve()
+
+
+def _normalize_config_path(config_path: Optional[Path]) -> Optional[Path]:
+    """Resolve a config path so equal files compare equal across cwd changes."""
+    if config_path is None:
+        return None
+    return Path(config_path).resolve()
+
+
+def _sink_config() -> Tuple[Dict[str, Any], Path]:
+    """Return the current logger config and the log file it resolves to."""
+    config = get_config_manager().get_logger_config()
+    log_path = _resolve_log_path(str(config.get("file", "app.log")), os.getcwd())
+    return config, log_path
 
 
 def _configure_logger():
     """Configure the global loguru logger once (idempotent, multi-process safe)."""
-    global _handler_ids
+    global _default_handler_removed, _buffered_sink, _active_sink_config
 
     if _handler_ids:
         return
 
-    try:
+    if not _default_handler_removed:
         _loguru_logger.remove()
-    except ValueError:
-        pass
-
-    config_manager = get_config_manager()
-    config = config_manager.get_logger_config()
-    log_file = config.get("file", "app.log")
-    log_path = Path(log_file)
+        _default_handler_removed = True
 
-    if not log_path.is_absolute():
-        log_path = Path.cwd() / log_path
-
-    log_path = log_path.resolve()
+    config, log_path = _active_sink_config = _sink_config()
 
     ensure_directory_exists(log_path)
 
-    handler_id = _loguru_logger.add(
-        sink=str(log_path),
-        format=config.get("format"),
-        level=config.get("level"),
-        rotation=config.get("rotation"),
-        retention=config.get("retention"),
-        compression=config.get("compression"),
-        mode="a",
-        backtrace=True,
-        diagnose=True,
-        enqueue=True,
-    )
+    buffer_size = config.get("buffer_size")
+    if buffer_size:
+        # The sink already moves file I/O to its own flush thread, so loguru's
+        # enqueue would only add a pickling round-trip per record.
+        _buffered_sink = BufferedFileSink(
+            log_path,
+            buffer_size=buffer_size,
+            flush_interval=config.get("flush_interval", 0.1),
+        )
+        handler_id = _loguru_logger.add(
+            sink=_buffered_sink,
+            format=config.get("format"),
+            level=config.get("level"),
+            backtrace=config.get("backtrace", False),
+            diagnose=config.get("diagnose", False),
+            enqueue=False,
+        )
+    else:
+        handler_id = _loguru_logger.add(
+            sink=str(log_path),
+            format=config.get("format"),
+            level=config.get("level"),
+            rotation=config.get("rotation"),
+            retention=config.get("retention"),
+            compression=config.get("compression"),
+            mode="a",
+            backtrace=config.get("backtrace", False),
+            diagnose=config.get("diagnose", False),
+            enqueue=config.get("enqueue", True),
+        )
     _handler_ids.append(handler_id)
 
     console_config = config.get("console", {})
     if console_config.get("enabled", True):
         console_id = _loguru_logger.add(
-            sink=lambda msg: print(msg, end=""),
+            sink=sys.stdout,
             format=config.get("format", "{message}"),
             level=console_config.get("level", config.get("level", "INFO")),
             colorize=console_config.get("colorize", True),
+            enqueue=config.get("enqueue", True),
         )
         _handler_ids.append(console_id)
 
 
+def _remove_handlers() -> None:
+    """Remove the sinks added by ``_configure_logger``, keeping user-added ones."""
+    global _buffered_sink, _active_sink_config
+
+    _buffered_sink = None
+    _active_sink_config = None
+    while _handler_ids:
+        try:
+            _loguru_logger.remove(_handler_ids.pop())
+        except ValueError:
+            pass
+
+
 class PyLogexLogger:
     """Wrapper around loguru logger."""
 
-    _LEVEL_MAP = {
-        "DEBUG": "debug",
-        "INFO": "info",
-        "WARNING": "warning",
-        "CRITICAL": "critical",
-    }
-
     def __init__(self, config_path: Optional[Path] = None):
         self._logger = _loguru_logger
-        _configure_logger()
+
+        # Bound straight to loguru: no wrapper frame per call, and loguru
+        # attributes each record to the caller's code rather than this module.
+        self.trace = self._logger.trace
+        self.debug = self._logger.debug
+        self.info = self._logger.info
+        self.success = self._logger.success
+        self.warning = self._logger.warning
+        self.error = self._logger.error
+        self.critical = self._logger.critical
+        self.log = self._logger.log
 
         if config_path:
             get_config_manager().load_config(config_path)
 
-    def trace(self, message: str, *args, **kwargs) -> None:
-        self._logger.trace(message, *args, **kwargs)
-
-    def debug(self, message: str, *args, **kwargs) -> None:
-        self._logger.debug(message, *args, **kwargs)
-
-    def info(self, message: str, *args, **kwargs) -> None:
-        self._logger.info(message, *args, **kwargs)
-
-    def success(self, message: str, *args, **kwargs) -> None:
-        self._logger.success(message, *args, **kwargs)
-
-    def warning(self, message: str, *args, **kwargs) -> None:
-        self._logger.warning(message, *args, **kwargs)
-
-    def error(self, message: str, *args, **kwargs) -> None:
-        self._logger.error(message, *args, **kwargs)
-
-    def critical(self, message: str, *args, **kwargs) -> None:
-        self._logger.critical(message, *args, **kwargs)
+        _configure_logger()
 
     def exception(
         self,
@@ -106,17 +153,10 @@ class PyLogexLogger:
         level: str = "ERROR",
         context: Optional[Dict[str, Any]] = None,
     ) -> None:
-        formatted = format_exception_for_logging(exc, level, context)
-        level_upper = level.upper()
-
-        if level_upper in self._LEVEL_MAP:
-            log_method = getattr(self._logger, self._LEVEL_MAP[level_upper])
-            log_method(formatted)
-        else:
-            self._logger.error(formatted)
-
-    def log(self, level: str, message: str, *args, **kwargs) -> None:
-        self._logger.log(level, message, *args, **kwargs)
+        log_method = _LEVEL_DISPATCH.get(level) or _LEVEL_DISPATCH.get(
+            level.upper(), _loguru_logger.error
+        )
+        log_method("{}", _LazyExceptionLog(exc, context))
 
     def bind(self, **kwargs):
         return self._logger.bind(**kwargs)
@@ -129,22 +169,40 @@ class PyLogexLogger:
 
     def complete(self) -> None:
         self._logger.complete()
+        if _buffered_sink is not None:
+            _buffered_sink.drain()
         sys.stderr.flush()
         sys.stdout.flush()
 
     def set_config(self, config_path: Path) -> None:
         """Reconfigure with new config."""
-        global _handler_ids
-        for handler_id in _handler_ids:
-            try:
-                self._logger.remove(handler_id)
-            except ValueError:
-                pass
-        _handler_ids.clear()
-        get_config_manager().load_config(config_path)
+        global _default_config_path
+
+        config_manager = get_config_manager()
+        config_manager.invalidate(config_path)
+        config_manager.load_config(config_path)
+        # Recorded only once loading succeeded, so a failed load is retried.
+        _default_config_path = _normalize_config_path(config_path)
+
+        # Unchanged sinks keep their open files instead of being re-added.
+        if _handler_ids and _sink_config() == _active_sink_config:
+            return
+
+        _remove_handlers()
         _configure_logger()
 
     def remove(self, handler_id=None) -> None:
+        global _active_sink_config, _buffered_sink
+
+        if handler_id is None:
+            _remove_handlers()
+        elif handler_id in _handler_ids:
+            # Any missing sink means the recorded setup is no longer live, so
+            # the next set_config() rebuilds instead of skipping.
+            _handler_ids.remove(handler_id)
+            _active_sink_config = None
+            if not _handler_ids:
+                _buffered_sink = None
         self._logger.remove(handler_id)
 
     def add(self, *args, **kwargs):
@@ -164,15 +222,54 @@ class PyLogexLogger:
 
 
 _default_logger: Optional[PyLogexLogger] = None
+_default_config_path: Optional[Path] = None
+_default_logger_lock = threading.Lock()
 
 
 def get_logger(config_path: Optional[Path] = None) -> PyLogexLogger:
     """Get logger instance (singleton pattern)."""
-    global _default_logger
+    global _default_logger, _default_config_path
 
-    if _default_logger is None:
-        _default_logger = PyLogexLogger(config_path=config_path)
-    elif config_path is not None:
-        _default_logger.set_config(config_path)
+    # Lock-free fast path: the logger exists and is already configured from
+    # the requested file.
+    default_logger = _default_logger
+    if default_logger is not None and config_path is None:
+        return default_logger
+
+    normalized_path = _normalize_config_path(config_path)
+    if default_logger is not None and normalized_path == _default_config_path:
+        return default_logger
+
+    with _default_logger_lock:
+        if _default_logger is None:
+            _default_logger = PyLogexLogger(config_path=config_path)
+            _default_config_path = normalized_path
+        elif config_path is not None and normalized_path != _default_config_path:
+            _default_logger.set_config(config_path)
 
     return _default_logger
+
+
+class _LazyLogger:
+    """Proxy for the default logger that defers configuration until first use."""
+
+    __slots__ = ("_instance",)
+
+    def __init__(self):
+        self._instance: Optional[PyLogexLogger] = None
+
+    def _get(self) -> PyLogexLogger:
+        if self._instance is None:
+            self._instance = get_logger()
+        return self._instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+    def __dir__(self):
+        return dir(self._get())
+
+    def __repr__(self) -> str:
+        if self._instance is None:
+            return "<py_logex default logger (not configured yet)>"
+        return repr(self._instance)
@@ -0,0 +1,114 @@
+"""Custom loguru sinks for py_logex."""
+
+import os
+import threading
+import weakref
+from functools import partial
+from pathlib import Path
+from typing import Union
+
+_ERROR_LEVELNO = 40
+
+
+def _reinit_in_child(ref: "weakref.ReferenceType[BufferedFileSink]") -> None:
+    sink = ref()
+    if sink is not None:
+        sink._after_fork_in_child()
+
+
+class BufferedFileSink:
+    """
+    File sink that coalesces records into batched writes.
+
+    Encoded records accumulate in memory and are written to the file with a
+    single ``write`` call once ``buffer_size`` bytes are pending,
+    ``flush_interval`` seconds after the first pending record (from a daemon
+    thread that sleeps while the buffer is empty), immediately for records
+    at ERROR level or above, and when loguru stops the sink (on ``remove()``
+    and at interpreter exit). After ``os.fork()`` the child starts with an
+    empty buffer and its own flush thread.
+
+    Rotation, retention and compression are features of loguru's own file
+    sink and are not applied to files written by this sink.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        buffer_size: int = 128 * 1024,
+        flush_interval: float = 0.1,
+    ):
+        os.makedirs(os.path.dirname(os.fspath(path)) or ".", exist_ok=True)
+        self._file = open(path, "ab", buffering=0)
+        self._buffer = bytearray()
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._start()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(
+                after_in_child=partial(_reinit_in_child, weakref.ref(self))
+            )
+
+    def _start(self) -> None:
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._pending = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="py_logex-flush", daemon=True
+        )
+        self._thread.start()
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Give a forked child its own buffer, lock and flush thread.
+
+        The records buffered at fork time belong to the parent, which still
+        writes them; the child only inherits the open file.
+        """
+        if self._file.closed:
+            return
+        self._buffer.clear()
+        self._start()
+
+    def write(self, message: str) -> None:
+        record = getattr(message, "record", None)
+        with self._lock:
+            if not self._buffer:
+                self._pending.set()
+            self._buffer += message.encode("utf8")
+            if len(self._buffer) >= self._buffer_size or (
+                record is not None and record["level"].no >= _ERROR_LEVELNO
+            ):
+                self._write_buffer()
+
+    def drain(self) -> None:
+        """
+        Flush buffered records to disk.
+
+        Not named ``flush``: loguru calls ``flush()`` after every write on
+        sinks that define it, which would defeat the buffer.
+        """
+        with self._lock:
+            self._write_buffer()
+
+    def stop(self) -> None:
+        """Stop the flush thread and close the file."""
+        self._stopped.set()
+        self._pending.set()
+        self._thread.join()
+        with self._lock:
+            self._write_buffer()
+            self._file.close()
+
+    def _write_buffer(self) -> None:
+        self._pending.clear()
+        if self._buffer and not self._file.closed:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+
+    def _run(self) -> None:
+        while True:
+            self._pending.wait()
+            if self._stopped.wait(self._flush_interval):
+                return
+            self.drain()
@@ -1,11 +1,13 @@
 """Utility functions for py_logex."""
 
-import inspect
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, Optional
 
 
+@lru_cache(maxsize=None)
 def get_script_name() -> str:
     """Get the name of the script that's running (without .py extension)."""
     try:
@@ -13,10 +15,8 @@ def get_script_name() -> str:
             main_file = sys.modules["__main__"].__file__
             if main_file:
                 return Path(main_file).stem
-        frame = inspect.currentframe()
-        if frame and frame.f_back:
-            caller_file = frame.f_back.f_code.co_filename
-            return Path(caller_file).stem
+        caller_file = sys._getframe(1).f_code.co_filename
+        return Path(caller_file).stem
     except Exception:
         pass
 
@@ -27,16 +27,14 @@ def walk_up_find_file(
     filename: str, start_path: Optional[Path] = None, max_levels: int = 5
 ) -> Optional[Path]:
     """Walk up directory tree looking for a specific file."""
-    if start_path is None:
-        start_path = Path.cwd()
+    current = os.getcwd() if start_path is None else os.fspath(start_path)
 
-    current = start_path
     for _ in range(max_levels):
-        file_path = current / filename
-        if file_path.exists() and file_path.is_file():
-            return file_path
+        candidate = os.path.join(current, filename)
+        if os.path.isfile(candidate):
+            return Path(candidate)
 
-        parent = current.parent
+        parent = os.path.dirname(current)
         if parent == current:
             break
         current = parent
@@ -44,21 +42,21 @@ def walk_up_find_file(
     return None
 
 
-def get_common_config_locations(filename: str = "logging.yaml") -> List[Path]:
-    """Get list of common configuration file locations to check."""
-    cwd = Path.cwd()
-    home = Path.home()
+_CONFIG_SUBDIRS = ((), ("config",), ("configs",), ("src", "config"), (".config",))
 
-    locations = [
-        cwd / filename,
-        cwd / "config" / filename,
-        cwd / "configs" / filename,
-        cwd / "src" / "config" / filename,
-        cwd / ".config" / filename,
-        home / ".py_logex" / filename,
-    ]
 
-    return locations
+def get_common_config_locations(filename: str = "logging.yaml") -> Iterator[Path]:
+    """
+    Yield common configuration file locations to check, in priority order.
+
+    Candidates are built lazily, so callers that stop at the first existing
+    file never build the rest (or look up the home directory).
+    """
+    cwd = os.getcwd()
+
+    for subdirs in _CONFIG_SUBDIRS:
+        yield Path(os.path.join(cwd, *subdirs, filename))
+    yield Path(os.path.join(os.path.expanduser("~"), ".py_logex", filename))
 
 
 def ensure_directory_exists(file_path: Path) -> None:
@@ -1,24 +1,13 @@
 """Tests for CLI functionality."""
 
-import shutil
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from py_logex import __version__
 from py_logex.cli import cmd_config_init, cmd_config_show, cmd_config_validate, main
+from py_logex.config import ConfigManager
 from py_logex.defaults import get_default_yaml
 
 
-@pytest.fixture
-def temp_dir():
-    """Create temporary directory for testing."""
-    temp = tempfile.mkdtemp()
-    yield Path(temp)
-    shutil.rmtree(temp)
-
-
 def test_cli_no_command(capsys):
     """Test CLI with no command shows help."""
     result = main([])
@@ -46,22 +35,22 @@ def test_cli_config_no_subcommand(capsys):
     assert "config" in captured.out.lower()
 
 
-def test_cli_config_init_default(temp_dir, monkeypatch, capsys):
+def test_cli_config_init_default(tmp_path, monkeypatch, capsys):
     """Test config init creates default file."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
     result = main(["config", "init"])
 
     assert result == 0
-    assert (temp_dir / "logging.yaml").exists()
+    assert (tmp_path / "logging.yaml").exists()
 
     captured = capsys.readouterr()
     assert "Created" in captured.out
 
 
-def test_cli_config_init_custom_output(temp_dir, capsys):
+def test_cli_config_init_custom_output(tmp_path, capsys):
     """Test config init with custom output path."""
-    output_path = temp_dir / "custom" / "config.yaml"
+    output_path = tmp_path / "custom" / "config.yaml"
 
     result = main(["config", "init", "-o", str(output_path)])
 
@@ -69,24 +58,24 @@ def test_cli_config_init_custom_output(temp_dir, capsys):
     assert output_path.exists()
 
 
-def test_cli_config_init_custom_name(temp_dir, monkeypatch, capsys):
+def test_cli_config_init_custom_name(tmp_path, monkeypatch, capsys):
     """Test config init with custom script name."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
     result = main(["config", "init", "-n", "myapp"])
 
     assert result == 0
 
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     content = config_file.read_text()
     assert "myapp.log" in content
 
 
-def test_cli_config_init_no_overwrite(temp_dir, monkeypatch, capsys):
+def test_cli_config_init_no_overwrite(tmp_path, monkeypatch, capsys):
     """Test config init doesn't overwrite without --force."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text("existing content")
 
     result = main(["config", "init"])
@@ -96,11 +85,11 @@ def test_cli_config_init_no_overwrite(temp_dir, monkeypatch, capsys):
     assert "already exists" in captured.err
 
 
-def test_cli_config_init_force_overwrite(temp_dir, monkeypatch, capsys):
+def test_cli_config_init_force_overwrite(tmp_path, monkeypatch, capsys):
     """Test config init with --force overwrites existing file."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text("existing content")
 
     result = main(["config", "init", "--force"])
@@ -109,12 +98,12 @@ def test_cli_config_init_force_overwrite(temp_dir, monkeypatch, capsys):
     assert "existing content" not in config_file.read_text()
 
 
-def test_cli_config_show(temp_dir, monkeypatch, capsys):
+def test_cli_config_show(tmp_path, monkeypatch, capsys):
     """Test config show displays configuration."""
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text(get_default_yaml("test"))
 
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
     result = main(["config", "show"])
 
@@ -124,9 +113,24 @@ def test_cli_config_show(temp_dir, monkeypatch, capsys):
     assert "logger:" in captured.out
 
 
-def test_cli_config_validate_valid(temp_dir, capsys):
+@pytest.mark.parametrize("command", ["show", "validate"])
+def test_cli_config_no_config_found(command, monkeypatch, capsys):
+    """Test that a failed discovery is reported instead of crashing."""
+    monkeypatch.setattr(
+        ConfigManager, "discover_config", lambda self, create_if_missing=True: None
+    )
+
+    result = main(["config", command])
+
+    assert result == 1
+    captured = capsys.readouterr()
+    assert "No configuration file found" in captured.err
+    assert "None" not in captured.out
+
+
+def test_cli_config_validate_valid(tmp_path, capsys):
     """Test validating valid configuration."""
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text(get_default_yaml("test"))
 
     result = main(["config", "validate", "-c", str(config_file)])
@@ -136,9 +140,9 @@ def test_cli_config_validate_valid(temp_dir, capsys):
     assert "valid" in captured.out.lower()
 
 
-def test_cli_config_validate_invalid_yaml(temp_dir, capsys):
+def test_cli_config_validate_invalid_yaml(tmp_path, capsys):
     """Test validating invalid YAML."""
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text("invalid: yaml: syntax:")
 
     result = main(["config", "validate", "-c", str(config_file)])
@@ -148,9 +152,9 @@ def test_cli_config_validate_invalid_yaml(temp_dir, capsys):
     assert "error" in captured.err.lower()
 
 
-def test_cli_config_validate_empty(temp_dir, capsys):
+def test_cli_config_validate_empty(tmp_path, capsys):
     """Test validating empty configuration."""
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text("")
 
     result = main(["config", "validate", "-c", str(config_file)])
@@ -160,9 +164,9 @@ def test_cli_config_validate_empty(temp_dir, capsys):
     assert "empty" in captured.err.lower()
 
 
-def test_cli_config_validate_missing_sections(temp_dir, capsys):
+def test_cli_config_validate_missing_sections(tmp_path, capsys):
     """Test validating config with missing required sections."""
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text("incomplete: config")
 
     result = main(["config", "validate", "-c", str(config_file)])
@@ -172,11 +176,11 @@ def test_cli_config_validate_missing_sections(temp_dir, capsys):
     assert "missing" in captured.err.lower()
 
 
-def test_cli_config_validate_autodiscover(temp_dir, monkeypatch, capsys):
+def test_cli_config_validate_autodiscover(tmp_path, monkeypatch, capsys):
     """Test validate without -c flag uses autodiscovery."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text(get_default_yaml("test"))
 
     result = main(["config", "validate"])
@@ -194,11 +198,11 @@ class MockArgs:
             setattr(self, key, value)
 
 
-def test_cmd_config_show_direct(temp_dir, monkeypatch, capsys):
+def test_cmd_config_show_direct(tmp_path, monkeypatch, capsys):
     """Test cmd_config_show function directly."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text(get_default_yaml("test"))
 
     args = MockArgs()
@@ -209,20 +213,20 @@ def test_cmd_config_show_direct(temp_dir, monkeypatch, capsys):
     assert "Configuration file:" in captured.out
 
 
-def test_cmd_config_init_direct(temp_dir, monkeypatch, capsys):
+def test_cmd_config_init_direct(tmp_path, monkeypatch, capsys):
     """Test cmd_config_init function directly."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
     args = MockArgs(output=None, name="testapp", force=False)
     result = cmd_config_init(args)
 
     assert result == 0
-    assert (temp_dir / "logging.yaml").exists()
+    assert (tmp_path / "logging.yaml").exists()
 
 
-def test_cmd_config_validate_direct(temp_dir, capsys):
+def test_cmd_config_validate_direct(tmp_path, capsys):
     """Test cmd_config_validate function directly."""
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text(get_default_yaml("test"))
 
     args = MockArgs(config=str(config_file))
@@ -1,32 +1,20 @@
 """Tests for configuration discovery."""
 
-import shutil
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from py_logex.config import ConfigManager
 from py_logex.defaults import get_default_yaml
 
 
-@pytest.fixture
-def temp_dir():
-    """Create temporary directory for testing."""
-    temp = tempfile.mkdtemp()
-    yield Path(temp)
-    shutil.rmtree(temp)
-
-
 @pytest.fixture
 def config_manager():
     """Create fresh config manager for each test."""
     return ConfigManager()
 
 
-def test_discover_config_creates_default(temp_dir, config_manager, monkeypatch):
+def test_discover_config_creates_default(tmp_path, config_manager, monkeypatch):
     """Test that default config is created when none exists."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
     config_path = config_manager.discover_config()
 
@@ -35,9 +23,9 @@ def test_discover_config_creates_default(temp_dir, config_manager, monkeypatch):
     assert "logger:" in config_path.read_text()
 
 
-def test_discover_config_from_env_var(temp_dir, config_manager, monkeypatch):
+def test_discover_config_from_env_var(tmp_path, config_manager, monkeypatch):
     """Test config discovery from environment variable."""
-    config_file = temp_dir / "custom" / "my-config.yaml"
+    config_file = tmp_path / "custom" / "my-config.yaml"
     config_file.parent.mkdir(parents=True)
     config_file.write_text(get_default_yaml("test"))
 
@@ -48,7 +36,7 @@ def test_discover_config_from_env_var(temp_dir, config_manager, monkeypatch):
     assert config_path.resolve() == config_file.resolve()
 
 
-def test_discover_config_env_var_not_found(temp_dir, config_manager, monkeypatch):
+def test_discover_config_env_var_not_found(tmp_path, config_manager, monkeypatch):
     """Test error when env var points to non-existent file."""
     monkeypatch.setenv("PYLOGEX_CONFIG", "/nonexistent/config.yaml")
 
@@ -56,12 +44,12 @@ def test_discover_config_env_var_not_found(temp_dir, config_manager, monkeypatch
         config_manager.discover_config()
 
 
-def test_discover_config_walk_up(temp_dir, config_manager, monkeypatch):
+def test_discover_config_walk_up(tmp_path, config_manager, monkeypatch):
     """Test config discovery by walking up directory tree."""
-    nested = temp_dir / "src" / "utils"
+    nested = tmp_path / "src" / "utils"
     nested.mkdir(parents=True)
 
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text(get_default_yaml("test"))
 
     monkeypatch.chdir(nested)
@@ -71,11 +59,11 @@ def test_discover_config_walk_up(temp_dir, config_manager, monkeypatch):
     assert config_path.resolve() == config_file.resolve()
 
 
-def test_discover_config_common_locations(temp_dir, config_manager, monkeypatch):
+def test_discover_config_common_locations(tmp_path, config_manager, monkeypatch):
     """Test config discovery from common locations."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
-    config_dir = temp_dir / "config"
+    config_dir = tmp_path / "config"
     config_dir.mkdir()
     config_file = config_dir / "logging.yaml"
     config_file.write_text(get_default_yaml("test"))
@@ -85,9 +73,9 @@ def test_discover_config_common_locations(temp_dir, config_manager, monkeypatch)
     assert config_path.resolve() == config_file.resolve()
 
 
-def test_load_config(temp_dir, config_manager, monkeypatch):
+def test_load_config(tmp_path, config_manager, monkeypatch):
     """Test loading configuration from file."""
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text(get_default_yaml("test"))
 
     config = config_manager.load_config(config_file)
@@ -96,9 +84,9 @@ def test_load_config(temp_dir, config_manager, monkeypatch):
     assert config["logger"]["level"] == "INFO"
 
 
-def test_get_logger_config_default(temp_dir, config_manager, monkeypatch):
+def test_get_logger_config_default(tmp_path, config_manager, monkeypatch):
     """Test getting default logger configuration."""
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text(get_default_yaml("test"))
 
     config_manager.load_config(config_file)
@@ -120,11 +108,91 @@ def test_config_defaults(config_manager):
     assert logger_config["console"]["enabled"] is True
 
 
-def test_config_path_tracking(temp_dir, config_manager):
+def test_config_path_tracking(tmp_path, config_manager):
     """Test that config path is tracked after loading."""
-    config_file = temp_dir / "logging.yaml"
+    config_file = tmp_path / "logging.yaml"
     config_file.write_text(get_default_yaml("test"))
 
     config_manager.load_config(config_file)
 
     assert config_manager.get_config_path() == config_file
+
+
+def test_load_config_reuses_cached_parse(tmp_path, config_manager):
+    """Test that reloading an unchanged file reuses the cached parse."""
+    config_file = tmp_path / "logging.yaml"
+    config_file.write_text(get_default_yaml("test"))
+
+    first = config_manager.load_config(config_file)
+    second = ConfigManager().load_config(config_file)
+
+    assert first is second
+
+
+def test_invalidate_forces_reparse(tmp_path, config_manager):
+    """Test that invalidate drops the cached parse for a file."""
+    config_file = tmp_path / "logging.yaml"
+    config_file.write_text(get_default_yaml("test"))
+
+    first = config_manager.load_config(config_file)
+    config_manager.invalidate()
+
+    assert config_manager.load_config(config_file) is not first
+
+
+def test_cached_parse_keyed_on_resolved_path(tmp_path, config_manager, monkeypatch):
+    """Test that one relative path from two directories reads two files."""
+    import os
+    from pathlib import Path
+
+    for name in ("aaa", "bbb"):
+        (tmp_path / name).mkdir()
+        config_file = tmp_path / name / "logging.yaml"
+        config_file.write_text(f"logger:\n  file: {name}.log\n")
+        os.utime(config_file, ns=(1_000_000_000, 1_000_000_000))
+
+    monkeypatch.chdir(tmp_path / "aaa")
+    config_manager.load_config(Path("logging.yaml"))
+    monkeypatch.chdir(tmp_path / "bbb")
+    config = config_manager.load_config(Path("logging.yaml"))
+
+    assert config["logger"]["file"] == "bbb.log"
+
+
+def test_load_config_substitutes_script_name(tmp_path, config_manager):
+    """Test that {script_name} placeholders are resolved at load time."""
+    config_file = tmp_path / "logging.yaml"
+    config_file.write_text(get_default_yaml("{script_name}"))
+
+    config = config_manager.load_config(config_file)
+
+    assert "{script_name}" not in config["logger"]["file"]
+    assert config_manager.get_logger_config()["file"] == config["logger"]["file"]
+
+
+def test_discover_config_is_cached(tmp_path, config_manager, monkeypatch):
+    """Test that discovery is remembered until invalidated."""
+    monkeypatch.chdir(tmp_path)
+
+    config_file = tmp_path / "logging.yaml"
+    config_file.write_text(get_default_yaml("test"))
+    first = config_manager.discover_config()
+
+    monkeypatch.setenv("PYLOGEX_CONFIG", str(config_file))
+
+    assert config_manager.discover_config() is first
+
+    config_manager.invalidate()
+
+    assert config_manager.discover_config() is not first
+
+
+def test_load_config_without_file_uses_defaults(tmp_path, config_manager, monkeypatch):
+    """Test that loading without a config file does not write one."""
+    monkeypatch.chdir(tmp_path)
+
+    config = config_manager.load_config()
+
+    assert config["logger"]["level"] == "INFO"
+    assert config_manager.get_config_path() is None
+    assert not (tmp_path / "logging.yaml").exists()
@@ -38,6 +38,24 @@ def test_format_exception_with_traceback():
         assert "level1" in formatted
 
 
+def test_format_exception_max_frames():
+    """Test that max_frames keeps only the innermost frames."""
+
+    def level3():
+        raise RuntimeError("Deep error")
+
+    def level2():
+        level3()
+
+    try:
+        level2()
+    except Exception as e:
+        formatted = ExceptionFormatter.format_exception(e, max_frames=1)
+
+        assert "level3" in formatted
+        assert "level2" not in formatted
+
+
 def test_get_exception_context():
     """Test extracting exception context."""
     try:
@@ -110,6 +128,15 @@ def test_exception_no_traceback():
     assert context["message"] == "No traceback"
     assert context["file"] is None
     assert context["line"] is None
+    assert context["code"] is None
+
+
+def test_format_exception_for_logging_no_traceback():
+    """Test formatting an exception that was never raised."""
+    formatted = format_exception_for_logging(ValueError("Never raised"))
+
+    assert "ValueError: Never raised" in formatted
+    assert "Location:" not in formatted
 
 
 def test_nested_exceptions():
@@ -171,3 +198,86 @@ def test_exception_context_file_name_only():
         assert "/" not in context["file"] or context["file"].count("/") == 0
 
         assert context["full_path"] is not None
+
+
+def test_format_exception_for_logging_clear_traceback():
+    """Test that clear_traceback consumes the traceback of the whole chain."""
+    try:
+        try:
+            raise KeyError("inner")
+        except KeyError as inner:
+            raise ValueError("outer") from inner
+    except Exception as e:
+        formatted = format_exception_for_logging(e, clear_traceback=True)
+
+        assert "Traceback" in formatted
+        assert e.__traceback__ is None
+        assert e.__cause__.__traceback__ is None
+
+
+def test_format_exception_zip_imported_source(tmp_path, monkeypatch):
+    """Test that source lines are shown for modules imported from a zip."""
+    import sys
+    import zipfile
+
+    archive = tmp_path / "z.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("zmod_frames.py", 'def fail():\n    raise ValueError("zipped")\n')
+    monkeypatch.syspath_prepend(str(archive))
+    monkeypatch.delitem(sys.modules, "zmod_frames", raising=False)
+
+    import zmod_frames
+
+    try:
+        zmod_frames.fail()
+    except Exception as e:
+        formatted = ExceptionFormatter.format_exception(e)
+
+        assert 'raise ValueError("zipped")' in formatted
+
+
+def test_exception_context_zip_imported_code(tmp_path, monkeypatch):
+    """Test that the code snippet is found for modules imported from a zip."""
+    import sys
+    import zipfile
+
+    archive = tmp_path / "z.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("zmod_context.py", 'def fail():\n    raise ValueError("zipped")\n')
+    monkeypatch.syspath_prepend(str(archive))
+    monkeypatch.delitem(sys.modules, "zmod_context", raising=False)
+
+    import zmod_context
+
+    try:
+        zmod_context.fail()
+    except Exception as e:
+        context = ExceptionFormatter.get_exception_context(e)
+
+        assert context["code"] == 'raise ValueError("zipped")'
+
+
+def test_format_exception_shows_edited_source(tmp_path, monkeypatch):
+    """Test that tracebacks pick up source edits, as extract_tb does."""
+    import os
+    import sys
+
+    module_file = tmp_path / "edited_mod.py"
+    module_file.write_text('def fail():\n    raise ValueError("original")\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "edited_mod", raising=False)
+
+    import edited_mod
+
+    for expected in ("original", "edited"):
+        if expected == "edited":
+            module_file.write_text('def fail():\n    raise ValueError("edited")\n')
+            os.utime(module_file, ns=(1_000_000_000, 1_000_000_000))
+        try:
+            edited_mod.fail()
+        except Exception as e:
+            formatted = ExceptionFormatter.format_exception(e)
+            context = ExceptionFormatter.get_exception_context(e)
+
+            assert f'raise ValueError("{expected}")' in formatted
+            assert context["code"] == f'raise ValueError("{expected}")'
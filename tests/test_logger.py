@@ -1,63 +1,48 @@
 """Tests for logger functionality."""
 
-import shutil
 import sys
-import tempfile
-import time
 from pathlib import Path
 
 import pytest
+from loguru import logger as loguru_logger
 
+import py_logex.config as config_module
 from py_logex import get_logger, logger
 
+# ``import py_logex.logger`` would bind the package's lazy ``logger`` attribute
+# rather than the module.
+logger_module = sys.modules["py_logex.logger"]
 
-@pytest.fixture(autouse=True)
-def reset_loggers():
-    """Reset logger singletons between tests."""
-    from loguru import logger as loguru_logger
-
-    logger_module = sys.modules.get("py_logex.logger")
-    if logger_module is None:
-        import py_logex.logger as logger_module
-
-    import py_logex.config
-
-    try:
-        loguru_logger.remove()
-    except ValueError:
-        pass
 
+def _reset_state():
+    if logger_module._buffered_sink is not None:
+        logger_module._buffered_sink.drain()
+    loguru_logger.remove()
     logger_module._default_logger = None
+    logger_module._default_config_path = None
     logger_module._handler_ids.clear()
-    py_logex.config._config_manager = py_logex.config.ConfigManager()
+    logger_module._active_sink_config = None
+    logger_module._buffered_sink = None
+    logger_module._default_handler_removed = False
+    config_module._config_manager = config_module.ConfigManager()
 
-    yield
 
-    try:
-        loguru_logger.remove()
-    except ValueError:
-        pass
+@pytest.fixture(autouse=True)
+def reset_loggers():
+    """Reset logger singletons between tests."""
+    _reset_state()
+
+    yield
 
     sys.stdout.flush()
     sys.stderr.flush()
+    _reset_state()
 
-    logger_module._default_logger = None
-    logger_module._handler_ids.clear()
-    py_logex.config._config_manager = py_logex.config.ConfigManager()
 
-
-@pytest.fixture
-def temp_dir():
-    """Create temporary directory for testing."""
-    temp = tempfile.mkdtemp()
-    yield Path(temp)
-    shutil.rmtree(temp)
-
-
-@pytest.fixture
-def test_config(temp_dir):
-    """Create test configuration file."""
-    config_file = temp_dir / "logging.yaml"
+@pytest.fixture(scope="session")
+def test_config(tmp_path_factory):
+    """Create the test configuration file once for the whole session."""
+    config_file = tmp_path_factory.mktemp("config") / "logging.yaml"
     config_content = """
 logger:
   file: test.log
@@ -65,6 +50,7 @@ logger:
   rotation: 10 MB
   retention: 1 days
   format: "{time} | {level} | {message}"
+  enqueue: false
   console:
     enabled: false
 """
@@ -80,9 +66,24 @@ def test_default_logger_import():
     assert hasattr(logger, "error")
 
 
-def test_logger_basic_logging(temp_dir, test_config, monkeypatch):
+def test_default_logger_is_lazy(tmp_path, test_config, monkeypatch):
+    """Test that the default logger is only configured on first use."""
+    from py_logex.logger import _LazyLogger
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv(config_module.ConfigManager.ENV_VAR, str(test_config))
+
+    lazy = _LazyLogger()
+    assert lazy._instance is None
+
+    lazy.info("First use")
+
+    assert lazy._instance is get_logger()
+
+
+def test_logger_basic_logging(tmp_path, test_config, monkeypatch):
     """Test basic logging functionality."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
     test_logger = get_logger(config_path=test_config)
 
@@ -91,9 +92,8 @@ def test_logger_basic_logging(temp_dir, test_config, monkeypatch):
     test_logger.warning("Test warning message")
 
     test_logger.complete()
-    time.sleep(0.1)
 
-    log_file = temp_dir / "test.log"
+    log_file = tmp_path / "test.log"
     assert log_file.exists()
 
     log_content = log_file.read_text()
@@ -101,17 +101,149 @@ def test_logger_basic_logging(temp_dir, test_config, monkeypatch):
     assert "Test debug message" in log_content
 
 
-def test_logger_singleton(test_config):
+def test_logger_buffered_file_complete(tmp_path, monkeypatch):
+    """Test that complete() drains the buffered file sink."""
+    config_file = tmp_path / "logging.yaml"
+    config_file.write_text(
+        """
+logger:
+  file: buffered.log
+  buffer_size: 65536
+  flush_interval: 60
+  console:
+    enabled: false
+"""
+    )
+    monkeypatch.chdir(tmp_path)
+
+    test_logger = get_logger(config_path=config_file)
+    test_logger.info("Buffered message")
+    test_logger.complete()
+
+    assert "Buffered message" in (tmp_path / "buffered.log").read_text()
+
+
+def test_logger_uses_explicit_config_on_first_call(tmp_path, monkeypatch):
+    """Test that the first get_logger(config_path) configures sinks from it."""
+    config_file = tmp_path / "configs" / "explicit.yaml"
+    config_file.parent.mkdir()
+    config_file.write_text(
+        """
+logger:
+  file: explicit.log
+  enqueue: false
+  console:
+    enabled: false
+"""
+    )
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+
+    test_logger = get_logger(config_path=config_file)
+    test_logger.info("Explicit config message")
+    test_logger.complete()
+
+    assert "Explicit config message" in (workdir / "explicit.log").read_text()
+
+
+def test_logger_singleton(tmp_path, test_config, monkeypatch):
     """Test that logger follows singleton pattern."""
+    monkeypatch.chdir(tmp_path)
+
     logger1 = get_logger(config_path=test_config)
     logger2 = get_logger(config_path=test_config)
 
     assert logger1 is logger2
 
 
-def test_logger_exception_handling(temp_dir, test_config, monkeypatch):
+def test_logger_same_config_path_not_reapplied(tmp_path, test_config, monkeypatch):
+    """Test that repeating the current config path keeps the existing sinks."""
+    monkeypatch.chdir(tmp_path)
+
+    get_logger(config_path=test_config)
+    handler_ids = list(logger_module._handler_ids)
+    get_logger(config_path=test_config)
+    get_logger(config_path=str(test_config))
+
+    assert logger_module._handler_ids == handler_ids
+
+
+def test_logger_relative_config_path_after_chdir(tmp_path, monkeypatch):
+    """Test that a relative config path is re-resolved after the cwd changes."""
+    for name in ("first", "second"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "logging.yaml").write_text(
+            f"""
+logger:
+  file: {name}.log
+  enqueue: false
+  console:
+    enabled: false
+"""
+        )
+
+    monkeypatch.chdir(tmp_path / "first")
+    get_logger(config_path=Path("logging.yaml"))
+    monkeypatch.chdir(tmp_path / "second")
+    test_logger = get_logger(config_path=Path("logging.yaml"))
+    test_logger.info("Second config message")
+    test_logger.complete()
+
+    assert "Second config message" in (tmp_path / "second" / "second.log").read_text()
+
+
+def test_logger_failed_config_is_retried(tmp_path, test_config, monkeypatch):
+    """Test that a config path that failed to load is not treated as current."""
+    monkeypatch.chdir(tmp_path)
+    test_logger = get_logger(config_path=test_config)
+
+    missing = tmp_path / "later.yaml"
+    with pytest.raises(FileNotFoundError):
+        test_logger.set_config(missing)
+
+    missing.write_text(
+        """
+logger:
+  file: later.log
+  enqueue: false
+  console:
+    enabled: false
+"""
+    )
+    get_logger(config_path=missing).info("Retried config message")
+    test_logger.complete()
+
+    assert "Retried config message" in (tmp_path / "later.log").read_text()
+
+
+def test_logger_singleton_concurrent_first_calls(tmp_path, test_config, monkeypatch):
+    """Test that concurrent first calls share one logger and one set of sinks."""
+    import threading
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv(config_module.ConfigManager.ENV_VAR, str(test_config))
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(get_logger())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+    assert len(logger_module._handler_ids) == 1
+
+
+def test_logger_exception_handling(tmp_path, test_config, monkeypatch):
     """Test exception logging."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
     test_logger = get_logger(config_path=test_config)
 
@@ -121,9 +253,8 @@ def test_logger_exception_handling(temp_dir, test_config, monkeypatch):
         test_logger.exception(e)
 
     test_logger.complete()
-    time.sleep(0.1)
 
-    log_file = temp_dir / "test.log"
+    log_file = tmp_path / "test.log"
     log_content = log_file.read_text()
 
     assert "ValueError" in log_content
@@ -131,9 +262,44 @@ def test_logger_exception_handling(temp_dir, test_config, monkeypatch):
     assert "Traceback" in log_content
 
 
-def test_logger_all_levels(temp_dir, test_config, monkeypatch):
+def test_logger_exception_filtered_level_not_formatted(tmp_path, monkeypatch):
+    """Test that exceptions below the configured level are never formatted."""
+    import py_logex.exceptions
+
+    config_file = tmp_path / "logging.yaml"
+    config_file.write_text(
+        """
+logger:
+  file: test.log
+  level: WARNING
+  enqueue: false
+  console:
+    enabled: false
+"""
+    )
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    monkeypatch.setattr(
+        py_logex.exceptions,
+        "format_exception_for_logging",
+        lambda *args, **kwargs: calls.append(args) or "formatted",
+    )
+
+    test_logger = get_logger(config_path=config_file)
+
+    try:
+        raise ValueError("Filtered exception")
+    except Exception as e:
+        test_logger.exception(e, level="INFO")
+        assert calls == []
+
+        test_logger.exception(e, level="ERROR")
+        assert len(calls) == 1
+
+
+def test_logger_all_levels(tmp_path, test_config, monkeypatch):
     """Test all logging levels."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
     test_logger = get_logger(config_path=test_config)
 
@@ -145,24 +311,24 @@ def test_logger_all_levels(temp_dir, test_config, monkeypatch):
     test_logger.critical("Critical message")
 
     test_logger.complete()
-    time.sleep(0.2)
 
-    log_file = temp_dir / "test.log"
+    log_file = tmp_path / "test.log"
     assert log_file.exists()
 
 
-def test_logger_reconfigure(temp_dir, test_config, monkeypatch):
+def test_logger_reconfigure(tmp_path, test_config, monkeypatch):
     """Test reconfiguring logger."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
     test_logger = get_logger(config_path=test_config)
     test_logger.info("Before reconfigure")
-    new_config = temp_dir / "new_logging.yaml"
+    new_config = tmp_path / "new_logging.yaml"
     new_config.write_text(
         """
     logger:
       file: new_test.log
       level: ERROR
+      enqueue: false
       console:
         enabled: false
     """
@@ -171,14 +337,68 @@ def test_logger_reconfigure(temp_dir, test_config, monkeypatch):
     test_logger.error("After reconfigure")
 
     test_logger.complete()
-    time.sleep(0.1)
 
-    assert (temp_dir / "new_test.log").exists()
+    assert (tmp_path / "new_test.log").exists()
+
+
+def test_logger_reconfigure_same_sinks_kept(tmp_path, test_config, monkeypatch):
+    """Test that set_config keeps sinks whose configuration did not change."""
+    monkeypatch.chdir(tmp_path)
+
+    test_logger = get_logger(config_path=test_config)
+    handler_ids = list(logger_module._handler_ids)
+
+    copy_config = tmp_path / "copy.yaml"
+    copy_config.write_text(test_config.read_text())
+    test_logger.set_config(copy_config)
+
+    assert logger_module._handler_ids == handler_ids
+
+
+def test_logger_reconfigure_after_removing_own_sink(tmp_path, test_config, monkeypatch):
+    """Test that set_config re-adds sinks removed through remove(handler_id)."""
+    monkeypatch.chdir(tmp_path)
+
+    test_logger = get_logger(config_path=test_config)
+    test_logger.remove(logger_module._handler_ids[0])
+
+    copy_config = tmp_path / "copy.yaml"
+    copy_config.write_text(test_config.read_text())
+    test_logger.set_config(copy_config)
+    test_logger.info("Sink restored")
+    test_logger.complete()
+
+    assert "Sink restored" in (tmp_path / "test.log").read_text()
+
+
+def test_logger_reconfigure_recreates_deleted_log_dir(tmp_path, monkeypatch):
+    """Test that reconfiguring recreates a log directory removed in the meantime."""
+    import shutil
+
+    config_file = tmp_path / "logging.yaml"
+    config_file.write_text(
+        """
+logger:
+  file: logs/app.log
+  buffer_size: 65536
+  console:
+    enabled: false
+"""
+    )
+    monkeypatch.chdir(tmp_path)
+
+    test_logger = get_logger(config_path=config_file)
+    test_logger.remove()
+    shutil.rmtree(tmp_path / "logs")
+
+    test_logger.set_config(config_file)
+
+    assert (tmp_path / "logs").is_dir()
 
 
-def test_logger_context_binding(temp_dir, test_config, monkeypatch):
+def test_logger_context_binding(tmp_path, test_config, monkeypatch):
     """Test logger context binding."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
     test_logger = get_logger(config_path=test_config)
 
@@ -186,15 +406,14 @@ def test_logger_context_binding(temp_dir, test_config, monkeypatch):
     bound_logger.info("User action")
 
     bound_logger.complete()
-    time.sleep(0.1)
 
-    log_file = temp_dir / "test.log"
+    log_file = tmp_path / "test.log"
     assert log_file.exists()
 
 
-def test_logger_catch_decorator(temp_dir, test_config, monkeypatch):
+def test_logger_catch_decorator(tmp_path, test_config, monkeypatch):
     """Test logger catch decorator."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
     test_logger = get_logger(config_path=test_config)
 
@@ -205,22 +424,20 @@ def test_logger_catch_decorator(temp_dir, test_config, monkeypatch):
     risky_function()
 
     test_logger.complete()
-    time.sleep(0.1)
 
-    log_file = temp_dir / "test.log"
+    log_file = tmp_path / "test.log"
     log_content = log_file.read_text()
     assert "RuntimeError" in log_content
 
 
-def test_console_disabled(temp_dir, test_config, monkeypatch, capsys):
+def test_console_disabled(tmp_path, test_config, monkeypatch, capsys):
     """Test that console output can be disabled."""
-    monkeypatch.chdir(temp_dir)
+    monkeypatch.chdir(tmp_path)
 
     test_logger = get_logger(config_path=test_config)
     test_logger.info("This should not appear in console")
 
     test_logger.complete()
-    time.sleep(0.1)
 
     captured = capsys.readouterr()
     assert "This should not appear in console" not in captured.out
@@ -0,0 +1,90 @@
+"""Tests for custom sinks."""
+
+import os
+import time
+
+import pytest
+from loguru import logger as loguru_logger
+
+from py_logex.sinks import BufferedFileSink
+
+
+def test_buffered_sink_writes_on_stop(tmp_path):
+    """Test that buffered records reach the file when the sink stops."""
+    log_file = tmp_path / "buffered.log"
+    sink = BufferedFileSink(log_file, flush_interval=60)
+    handler_id = loguru_logger.add(sink, format="{message}", level="DEBUG")
+
+    loguru_logger.info("Buffered message")
+    loguru_logger.remove(handler_id)
+
+    assert "Buffered message" in log_file.read_text()
+
+
+def test_buffered_sink_flushes_errors(tmp_path):
+    """Test that ERROR records are flushed immediately."""
+    log_file = tmp_path / "buffered.log"
+    sink = BufferedFileSink(log_file, flush_interval=60)
+    handler_id = loguru_logger.add(sink, format="{message}", level="DEBUG")
+
+    try:
+        loguru_logger.info("Info message")
+        assert log_file.read_text() == ""
+
+        loguru_logger.error("Error message")
+        assert "Error message" in log_file.read_text()
+    finally:
+        loguru_logger.remove(handler_id)
+
+
+def test_buffered_sink_flushes_after_interval(tmp_path):
+    """Test that pending records are flushed once the interval elapses."""
+    log_file = tmp_path / "buffered.log"
+    sink = BufferedFileSink(log_file, flush_interval=0.01)
+    handler_id = loguru_logger.add(sink, format="{message}", level="DEBUG")
+
+    try:
+        loguru_logger.info("Timed message")
+        for _ in range(100):
+            if "Timed message" in log_file.read_text():
+                break
+            time.sleep(0.01)
+
+        assert "Timed message" in log_file.read_text()
+    finally:
+        loguru_logger.remove(handler_id)
+
+
+def test_buffered_sink_creates_missing_directory(tmp_path):
+    """Test that the sink creates the log file's parent directories."""
+    log_file = tmp_path / "missing" / "nested" / "buffered.log"
+    sink = BufferedFileSink(log_file, flush_interval=60)
+    handler_id = loguru_logger.add(sink, format="{message}", level="DEBUG")
+
+    loguru_logger.info("Nested message")
+    loguru_logger.remove(handler_id)
+
+    assert "Nested message" in log_file.read_text()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_buffered_sink_after_fork(tmp_path):
+    """Test that a forked child neither rewrites nor strands buffered records."""
+    log_file = tmp_path / "buffered.log"
+    sink = BufferedFileSink(log_file, flush_interval=0.05)
+    handler_id = loguru_logger.add(sink, format="{message}", level="DEBUG")
+
+    try:
+        loguru_logger.info("parent-before-fork")
+        pid = os.fork()
+        if pid == 0:
+            loguru_logger.info("child-record")
+            time.sleep(0.5)
+            os._exit(0)
+        os.waitpid(pid, 0)
+    finally:
+        loguru_logger.remove(handler_id)
+
+    content = log_file.read_text()
+    assert content.count("parent-before-fork") == 1
+    assert "child-record" in content